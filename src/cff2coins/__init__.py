@@ -1,2 +1,7 @@
 from coins_parser import CoinsParser, CoinSpan, CoinSpanList, CoinSpanTerm
-from cff2coins.models.cff_coin_span import CffCoinSpan, CffCoinSpanList
+from cff2coins.models.cff_coin_span import (
+    CffCoinSpan,
+    CffCoinSpanList,
+    CffCoinSpanResult,
+)
+from cff2coins.models.cff_schema_validator import CffSchemaValidator
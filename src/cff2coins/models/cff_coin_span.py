@@ -2,9 +2,18 @@ from __future__ import annotations
 
 # from typing import overload, Optional, Union
 from pathlib import Path
+from typing import IO, Iterator, NamedTuple
+import tarfile
 from coins_parser import CoinsParser, CoinSpanList, CoinSpan, CoinSpanTerm
 import yaml
 
+try:
+    from yaml import CSafeLoader as CffYamlLoader
+except ImportError:
+    from yaml import SafeLoader as CffYamlLoader
+
+from cff2coins.models.cff_schema_validator import CffSchemaValidator
+
 from importlib.metadata import version, PackageNotFoundError
 
 
@@ -77,11 +86,22 @@ class CffCoinSpan:
         for author in cff["authors"]:
 
             if "name" in author:
-                author_full_name: str = author["name"]
+                author_full_name: str = str(author["name"]).strip()
             else:
+                # the CFF schema allows a person with only given or family names,
+                # and YAML can load a name part as a date, so each part is a str
                 author_full_name: str = " ".join(
-                    [author["given-names"], author["family-names"]]
-                )
+                    [
+                        str(author[name_part]).strip()
+                        for name_part in ["given-names", "family-names"]
+                        if name_part in author
+                    ]
+                ).strip()
+            if author_full_name == "" and "alias" in author:
+                author_full_name = str(author["alias"]).strip()
+            # skip authors without any name rather than emit an empty rft.au
+            if author_full_name == "":
+                continue
             coins_author_metadata.append(
                 ("rft.au", author_full_name),
             )
@@ -206,6 +226,19 @@ class CffCoinSpan:
                 + ", ".join(SUPPORTED_CFF_VERSIONS)
             )
 
+    @classmethod
+    def is_valid_cff(cls, cff: dict) -> tuple[bool, list[Exception]]:
+        # checks the whole CFF dictionary against the CFF schema in one pass,
+        # so it can be used to filter CFF dictionaries before conversion
+        cff_version = cff.get("cff-version") if isinstance(cff, dict) else None
+        if cff_version not in SUPPORTED_CFF_VERSIONS:
+            cff_version = SUPPORTED_CFF_VERSIONS[-1]
+        validator = CffSchemaValidator.for_cff_version(cff_version)
+        exceptions: list[Exception] = [
+            ValueError(f"Invalid CFF: {error}") for error in validator.errors(cff)
+        ]
+        return len(exceptions) == 0, exceptions
+
     @classmethod
     def from_cff_dict(
         cls,
@@ -280,6 +313,119 @@ class CffCoinSpan:
             referrer_id=referrer_id,
         )
 
+    @classmethod
+    def _from_cff_document(
+        cls,
+        cff: dict | None,
+        source: str | None = None,
+        index: int = 0,
+        publisher: str | None = None,
+        language: str | None = None,
+        referrer_id: str | None = None,
+    ) -> CffCoinSpanResult:
+        try:
+            cff_coin_span = cls.from_cff_dict(
+                cff=cff or {},
+                publisher=publisher,
+                language=language,
+                referrer_id=referrer_id,
+            )
+        except Exception as e:
+            return CffCoinSpanResult(source, index, None, e)
+        return CffCoinSpanResult(source, index, cff_coin_span, None)
+
+    @classmethod
+    def from_cff_stream(
+        cls,
+        cff_stream: str | bytes | IO,
+        source: str | None = None,
+        publisher: str | None = None,
+        language: str | None = None,
+        referrer_id: str | None = None,
+    ) -> Iterator[CffCoinSpanResult]:
+        # lazily converts each document of a multi-document YAML stream,
+        # so only one document is in memory at a time.
+        # an invalid document yields its exception instead of a CffCoinSpan.
+        # each result carries the given source and the document's index in the stream.
+        # empty documents, e.g. after a trailing '---', are skipped.
+        loader = CffYamlLoader(cff_stream)
+        index = 0
+        try:
+            while True:
+                try:
+                    if not loader.check_node():
+                        return
+                    node = loader.get_node()
+                except Exception as e:
+                    # the YAML parser cannot resume after a syntax error
+                    yield CffCoinSpanResult(source, index, None, e)
+                    return
+
+                # each document is constructed from its own node, so a value
+                # that cannot be constructed (e.g. the date 2025-02-30)
+                # only fails its own document
+                try:
+                    cff = loader.construct_document(node)
+                except Exception as e:
+                    loader.constructed_objects = {}
+                    loader.recursive_objects = {}
+                    loader.state_generators = []
+                    loader.deep_construct = False
+                    yield CffCoinSpanResult(source, index, None, e)
+                else:
+                    if cff is not None:
+                        yield cls._from_cff_document(
+                            cff=cff,
+                            source=source,
+                            index=index,
+                            publisher=publisher,
+                            language=language,
+                            referrer_id=referrer_id,
+                        )
+                index += 1
+        finally:
+            loader.dispose()
+
+    @classmethod
+    def from_cff_tar(
+        cls,
+        tar_file_path: Path,
+        publisher: str | None = None,
+        language: str | None = None,
+        referrer_id: str | None = None,
+    ) -> Iterator[CffCoinSpanResult]:
+        # reads the tar file sequentially, so it can be compressed or very large.
+        # every regular member whose name ends with '.cff' is read as a CFF stream,
+        # and its results have the member name as their source.
+        with tarfile.open(tar_file_path, mode="r|*") as tar:
+            for member in tar:
+                if not (member.isfile() and member.name.endswith(".cff")):
+                    continue
+                cff_file = tar.extractfile(member)
+                if cff_file is None:
+                    continue
+                document_count = 0
+                for result in cls.from_cff_stream(
+                    cff_stream=cff_file,
+                    source=member.name,
+                    publisher=publisher,
+                    language=language,
+                    referrer_id=referrer_id,
+                ):
+                    document_count += 1
+                    yield result
+                if document_count == 0:
+                    # an empty CFF file (or one with only empty documents)
+                    # is an empty CFF dictionary, as in from_cff_file
+                    yield cls._from_cff_document(
+                        cff={},
+                        source=member.name,
+                        index=0,
+                        publisher=publisher,
+                        language=language,
+                        referrer_id=referrer_id,
+                    )
+
     @classmethod
     def from_html_file(
         cls,
@@ -428,3 +574,13 @@ class CffCoinSpan:
 
 
 CffCoinSpanList = list[CffCoinSpan]
+
+
+class CffCoinSpanResult(NamedTuple):
+    # the result of converting one document of a CFF stream or tar file.
+    # source is the tar member name (or the source given to from_cff_stream),
+    # and index is the position of the document within that stream.
+    source: str | None
+    index: int
+    cff_coin_span: CffCoinSpan | None
+    exception: Exception | None
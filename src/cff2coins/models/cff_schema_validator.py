@@ -0,0 +1,474 @@
+from __future__ import annotations
+
+import json
+import re
+import timeit
+from datetime import date
+from functools import lru_cache
+from importlib.resources import files
+from typing import Any, Callable, Iterable, Iterator
+
+# A compiled check appends one message per violation to `errors`.
+# The path is a tuple of keys and indexes. It is only formatted when a check fails.
+CffSchemaCheck = Callable[[Any, tuple, list], None]
+
+DEFAULT_CFF_SCHEMA_VERSION = "1.2.0"
+
+# keywords that only annotate a schema and never reject a value
+# ('format' is an annotation by default in draft-07, as in jsonschema)
+ANNOTATION_KEYWORDS = frozenset(
+    [
+        "$comment",
+        "$id",
+        "$schema",
+        "default",
+        "definitions",
+        "description",
+        "examples",
+        "format",
+        "title",
+    ]
+)
+
+
+def load_cff_schema(cff_version: str = DEFAULT_CFF_SCHEMA_VERSION) -> dict:
+    schema_file = (
+        files("cff2coins")
+        .joinpath("schemas")
+        .joinpath(cff_version)
+        .joinpath("schema.json")
+    )
+    if not schema_file.is_file():
+        raise ValueError(
+            f"Invalid CFF schema version: no schema is bundled for cff-version '{cff_version}'"
+        )
+    return json.loads(schema_file.read_text(encoding="UTF-8"))
+
+
+def format_cff_path(path: tuple) -> str:
+    formatted_path = "cff"
+    for key in path:
+        if isinstance(key, int):
+            formatted_path += f"[{key}]"
+        else:
+            formatted_path += f".{key}"
+    return formatted_path
+
+
+def _as_string(value: Any) -> str | None:
+    # YAML loads unquoted dates as date objects,
+    # but the CFF schema expects them as strings.
+    if isinstance(value, str):
+        return value
+    if isinstance(value, date):
+        return value.isoformat()
+    return None
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+# keywords that can reject a value, and the methods that compile them
+# ('properties' and 'additionalProperties' are compiled together)
+KEYWORD_COMPILERS: dict[str, str] = {
+    "$ref": "_compile_ref",
+    "anyOf": "_compile_any_of",
+    "enum": "_compile_enum",
+    "items": "_compile_items",
+    "maxLength": "_compile_max_length",
+    "maximum": "_compile_maximum",
+    "minItems": "_compile_min_items",
+    "minLength": "_compile_min_length",
+    "minimum": "_compile_minimum",
+    "oneOf": "_compile_one_of",
+    "pattern": "_compile_pattern",
+    "required": "_compile_required",
+    "type": "_compile_type",
+    "uniqueItems": "_compile_unique_items",
+}
+
+TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "array": lambda value: isinstance(value, list),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": _is_integer,
+    "null": lambda value: value is None,
+    "number": _is_number,
+    "object": lambda value: isinstance(value, dict),
+    "string": lambda value: _as_string(value) is not None,
+}
+
+
+def _freeze(value: Any) -> Any:
+    # hashable form of a JSON value that follows JSON equality,
+    # e.g. True and 1 differ, but 1 and 1.0 are equal
+    if isinstance(value, dict):
+        return ("object", frozenset((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, list):
+        return ("array", tuple(_freeze(v) for v in value))
+    if isinstance(value, bool):
+        return ("boolean", value)
+    if _is_number(value):
+        return ("number", value)
+    string_value = _as_string(value)
+    if string_value is not None:
+        return ("string", string_value)
+    if value is None:
+        return ("null", None)
+    # YAML can also load values that are not JSON, e.g. bytes (!!binary) or sets (!!set)
+    return ("other", type(value).__name__, repr(value))
+
+
+class CffSchemaValidator:
+    """Validates CFF dictionaries against the CFF JSON schema.
+
+    The schema is compiled once into nested check functions, one for each subschema.
+    Each function only runs the keywords that its subschema uses.
+    A document is validated in a single pass, and every error is collected.
+    """
+
+    def __init__(self, schema: dict | None = None):
+        if schema is None:
+            schema = load_cff_schema()
+        self.schema: dict = schema
+        self._ref_cells: dict[str, list[CffSchemaCheck]] = {}
+        self._check: CffSchemaCheck = self._compile(schema)
+
+    @classmethod
+    def for_cff_version(cls, cff_version: str) -> CffSchemaValidator:
+        return _get_cff_schema_validator(cff_version)
+
+    def errors(self, cff: Any) -> list[str]:
+        errors: list = []
+        self._check(cff, (), errors)
+        return [f"{format_cff_path(path)}: {message}" for path, message in errors]
+
+    def is_valid(self, cff: Any) -> bool:
+        return len(self.errors(cff)) == 0
+
+    def validate(self, cff: Any) -> None:
+        errors = self.errors(cff)
+        if len(errors):
+            raise ValueError(
+                "Invalid CFF: CFF dictionary does not match the CFF schema: "
+                + "; ".join(errors)
+            )
+
+    def iter_errors_many(self, cffs: Iterable[Any]) -> Iterator[list[str]]:
+        for cff in cffs:
+            yield self.errors(cff)
+
+    def errors_many(self, cffs: Iterable[Any]) -> list[list[str]]:
+        return list(self.iter_errors_many(cffs))
+
+    def _compile(self, schema: Any) -> CffSchemaCheck:
+        if schema is True or schema == {}:
+            return _check_nothing
+        if schema is False:
+            return _check_false
+
+        checks: list[CffSchemaCheck] = []
+        for keyword, argument in schema.items():
+            if keyword in ANNOTATION_KEYWORDS or keyword in (
+                "properties",
+                "additionalProperties",
+            ):
+                continue
+            compile_keyword_name = KEYWORD_COMPILERS.get(keyword)
+            if compile_keyword_name is None:
+                raise ValueError(
+                    f"Invalid CFF schema: unsupported schema keyword '{keyword}'"
+                )
+            compile_keyword = getattr(self, compile_keyword_name)
+            checks.append(compile_keyword(argument, schema))
+        if "properties" in schema or "additionalProperties" in schema:
+            checks.append(self._compile_properties(schema))
+
+        if len(checks) == 0:
+            return _check_nothing
+        if len(checks) == 1:
+            return checks[0]
+        checks_tuple = tuple(checks)
+
+        def check_all(value, path, errors):
+            for check in checks_tuple:
+                check(value, path, errors)
+
+        return check_all
+
+    def _compile_ref(self, ref: str, schema: dict) -> CffSchemaCheck:
+        if ref in self._ref_cells:
+            cell = self._ref_cells[ref]
+        else:
+            # register the cell before compiling, so recursive references resolve
+            cell = [_check_nothing]
+            self._ref_cells[ref] = cell
+            cell[0] = self._compile(self._resolve_ref(ref))
+
+        def check_ref(value, path, errors):
+            cell[0](value, path, errors)
+
+        return check_ref
+
+    def _resolve_ref(self, ref: str) -> Any:
+        if not ref.startswith("#"):
+            raise ValueError(
+                f"Invalid CFF schema: only local references are supported, not '{ref}'"
+            )
+        target: Any = self.schema
+        for part in ref[1:].split("/"):
+            if part == "":
+                continue
+            target = target[part.replace("~1", "/").replace("~0", "~")]
+        return target
+
+    def _compile_type(self, type_name: str | list[str], schema: dict) -> CffSchemaCheck:
+        type_names = [type_name] if isinstance(type_name, str) else type_name
+        type_checks = tuple(TYPE_CHECKS[name] for name in type_names)
+        expected = ", ".join(type_names)
+
+        def check_type(value, path, errors):
+            for type_check in type_checks:
+                if type_check(value):
+                    return
+            errors.append((path, f"{value!r} is not of type '{expected}'"))
+
+        return check_type
+
+    def _compile_enum(self, enum: list, schema: dict) -> CffSchemaCheck:
+        allowed = frozenset(_freeze(value) for value in enum)
+
+        def check_enum(value, path, errors):
+            if _freeze(value) not in allowed:
+                errors.append((path, f"{value!r} is not one of {enum!r}"))
+
+        return check_enum
+
+    def _compile_pattern(self, pattern: str, schema: dict) -> CffSchemaCheck:
+        search = re.compile(pattern).search
+
+        def check_pattern(value, path, errors):
+            string_value = _as_string(value)
+            if string_value is not None and search(string_value) is None:
+                errors.append((path, f"{string_value!r} does not match {pattern!r}"))
+
+        return check_pattern
+
+    def _compile_min_length(self, min_length: int, schema: dict) -> CffSchemaCheck:
+        def check_min_length(value, path, errors):
+            string_value = _as_string(value)
+            if string_value is not None and len(string_value) < min_length:
+                errors.append(
+                    (path, f"{string_value!r} is shorter than {min_length} characters")
+                )
+
+        return check_min_length
+
+    def _compile_max_length(self, max_length: int, schema: dict) -> CffSchemaCheck:
+        def check_max_length(value, path, errors):
+            string_value = _as_string(value)
+            if string_value is not None and len(string_value) > max_length:
+                errors.append(
+                    (path, f"{string_value!r} is longer than {max_length} characters")
+                )
+
+        return check_max_length
+
+    def _compile_minimum(self, minimum: float, schema: dict) -> CffSchemaCheck:
+        def check_minimum(value, path, errors):
+            if _is_number(value) and value < minimum:
+                errors.append((path, f"{value!r} is less than the minimum of {minimum}"))
+
+        return check_minimum
+
+    def _compile_maximum(self, maximum: float, schema: dict) -> CffSchemaCheck:
+        def check_maximum(value, path, errors):
+            if _is_number(value) and value > maximum:
+                errors.append(
+                    (path, f"{value!r} is greater than the maximum of {maximum}")
+                )
+
+        return check_maximum
+
+    def _compile_min_items(self, min_items: int, schema: dict) -> CffSchemaCheck:
+        def check_min_items(value, path, errors):
+            if isinstance(value, list) and len(value) < min_items:
+                errors.append((path, f"array has fewer than {min_items} items"))
+
+        return check_min_items
+
+    def _compile_unique_items(self, unique_items: bool, schema: dict) -> CffSchemaCheck:
+        if not unique_items:
+            return _check_nothing
+
+        def check_unique_items(value, path, errors):
+            if isinstance(value, list):
+                seen: set = set()
+                for item in value:
+                    frozen_item = _freeze(item)
+                    if frozen_item in seen:
+                        errors.append((path, f"array has non-unique item {item!r}"))
+                        return
+                    seen.add(frozen_item)
+
+        return check_unique_items
+
+    def _compile_items(self, items: Any, schema: dict) -> CffSchemaCheck:
+        if isinstance(items, list):
+            raise ValueError("Invalid CFF schema: tuple 'items' is not supported")
+        check_item = self._compile(items)
+        if check_item is _check_nothing:
+            return _check_nothing
+
+        def check_items(value, path, errors):
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    check_item(item, path + (index,), errors)
+
+        return check_items
+
+    def _compile_required(self, required: list[str], schema: dict) -> CffSchemaCheck:
+        required_tuple = tuple(required)
+
+        def check_required(value, path, errors):
+            if isinstance(value, dict):
+                for name in required_tuple:
+                    if name not in value:
+                        errors.append((path, f"'{name}' is a required property"))
+
+        return check_required
+
+    def _compile_properties(self, schema: dict) -> CffSchemaCheck:
+        property_checks: dict[str, CffSchemaCheck] = {
+            name: self._compile(subschema)
+            for name, subschema in schema.get("properties", {}).items()
+        }
+        additional_properties = schema.get("additionalProperties", True)
+        if isinstance(additional_properties, dict):
+            check_additional = self._compile(additional_properties)
+        elif additional_properties is False:
+            check_additional = None
+        else:
+            check_additional = _check_nothing
+
+        def check_properties(value, path, errors):
+            if not isinstance(value, dict):
+                return
+            for name, property_value in value.items():
+                property_check = property_checks.get(name)
+                if property_check is not None:
+                    property_check(property_value, path + (name,), errors)
+                elif check_additional is None:
+                    errors.append(
+                        (path, f"additional property '{name}' is not allowed")
+                    )
+                else:
+                    check_additional(property_value, path + (name,), errors)
+
+        return check_properties
+
+    def _compile_any_of(self, subschemas: list, schema: dict) -> CffSchemaCheck:
+        branch_checks = tuple(self._compile(subschema) for subschema in subschemas)
+
+        def check_any_of(value, path, errors):
+            for branch_check in branch_checks:
+                branch_errors: list = []
+                branch_check(value, path, branch_errors)
+                if len(branch_errors) == 0:
+                    return
+            errors.append(
+                (path, f"{value!r} is not valid under any of the given schemas")
+            )
+
+        return check_any_of
+
+    def _compile_one_of(self, subschemas: list, schema: dict) -> CffSchemaCheck:
+        branch_checks = tuple(self._compile(subschema) for subschema in subschemas)
+
+        def check_one_of(value, path, errors):
+            valid_branch_count = 0
+            for branch_check in branch_checks:
+                branch_errors: list = []
+                branch_check(value, path, branch_errors)
+                if len(branch_errors) == 0:
+                    valid_branch_count += 1
+            if valid_branch_count == 0:
+                errors.append(
+                    (path, f"{value!r} is not valid under any of the given schemas")
+                )
+            elif valid_branch_count > 1:
+                errors.append(
+                    (path, f"{value!r} is valid under more than one of the given schemas")
+                )
+
+        return check_one_of
+
+
+def _check_nothing(value, path, errors):
+    pass
+
+
+def _check_false(value, path, errors):
+    errors.append((path, f"{value!r} is not allowed"))
+
+
+@lru_cache(maxsize=None)
+def _get_cff_schema_validator(cff_version: str) -> CffSchemaValidator:
+    return CffSchemaValidator(schema=load_cff_schema(cff_version))
+
+
+def _to_json_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _to_json_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_json_value(v) for v in value]
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def benchmark_cff_schema_validator(
+    cffs: list[Any],
+    number: int = 10,
+    cff_version: str = DEFAULT_CFF_SCHEMA_VERSION,
+) -> dict[str, float | int]:
+    """Times the compiled validator against jsonschema's generic Draft7Validator.
+
+    Returns the seconds each validator needs for `number` passes over `cffs`,
+    and the number of documents on which the two validators disagree.
+    Requires the optional 'jsonschema' package.
+    """
+    try:
+        import jsonschema
+    except ImportError as e:
+        raise ImportError(
+            "The CFF schema validator benchmark requires the 'jsonschema' package."
+        ) from e
+
+    validator = CffSchemaValidator.for_cff_version(cff_version)
+    jsonschema_validator = jsonschema.Draft7Validator(validator.schema)
+    # jsonschema has no notion of YAML dates, so it gets plain JSON values
+    json_cffs = [_to_json_value(cff) for cff in cffs]
+
+    disagreements = sum(
+        validator.is_valid(cff) != jsonschema_validator.is_valid(json_cff)
+        for cff, json_cff in zip(cffs, json_cffs)
+    )
+    cff2coins_seconds = timeit.timeit(
+        lambda: validator.errors_many(cffs), number=number
+    )
+    jsonschema_seconds = timeit.timeit(
+        lambda: [list(jsonschema_validator.iter_errors(c)) for c in json_cffs],
+        number=number,
+    )
+    return {
+        "cff2coins": cff2coins_seconds,
+        "jsonschema": jsonschema_seconds,
+        "disagreements": disagreements,
+    }
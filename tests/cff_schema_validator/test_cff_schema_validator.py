@@ -0,0 +1,98 @@
+from pathlib import Path
+import json
+
+import pytest
+import yaml
+
+from cff2coins import CffCoinSpan, CffSchemaValidator
+from cff2coins.models.cff_schema_validator import benchmark_cff_schema_validator
+from tests.utils import load_json_string
+
+
+def load_cff(test_name: str) -> dict:
+    input_cff_file_path: Path = Path(
+        "tests", "cff_schema_validator", test_name, "input.cff"
+    )
+    return yaml.safe_load(input_cff_file_path.read_text(encoding="UTF-8")) or {}
+
+
+def load_all_test_cffs() -> list[dict]:
+    return [
+        cff or {}
+        for cff_file_path in sorted(Path("tests").glob("**/*.cff"))
+        for cff in yaml.safe_load_all(cff_file_path.read_text(encoding="UTF-8"))
+    ]
+
+
+def test_cff_schema_validator_for_valid_cff_file():
+    cff: dict = load_cff("valid_cff_file")
+    assert CffSchemaValidator().errors(cff) == []
+    cff_coin_span = CffCoinSpan.from_cff_dict(cff=cff)
+    assert ("rft.au", "Only") in cff_coin_span.coin_span
+
+
+def test_cff_schema_validator_collects_all_errors_for_invalid_cff_file():
+    cff: dict = load_cff("invalid_cff_file")
+    actual_json = json.dumps(CffSchemaValidator().errors(cff), ensure_ascii=False)
+    expected_json: str = load_json_string(
+        test_group="cff_schema_validator",
+        test_name="invalid_cff_file",
+        file_name="expected.json",
+    )
+    assert actual_json == expected_json
+
+
+def test_cff_schema_validator_validate_raises_value_error():
+    with pytest.raises(ValueError) as e:
+        CffSchemaValidator().validate(load_cff("invalid_cff_file"))
+    assert str(e.value).startswith(
+        "Invalid CFF: CFF dictionary does not match the CFF schema: "
+    )
+
+
+def test_is_valid_cff():
+    assert CffCoinSpan.is_valid_cff(load_cff("valid_cff_file")) == (True, [])
+    is_valid, exceptions = CffCoinSpan.is_valid_cff(load_cff("invalid_cff_file"))
+    assert not is_valid
+    assert len(exceptions) == 7
+
+
+def test_cff_schema_validator_errors_many():
+    cffs = [load_cff("valid_cff_file"), load_cff("invalid_cff_file")]
+    errors_many = CffSchemaValidator().errors_many(cffs)
+    assert [len(errors) for errors in errors_many] == [0, 7]
+
+
+def test_cff_schema_validator_agrees_with_jsonschema():
+    pytest.importorskip("jsonschema")
+    results = benchmark_cff_schema_validator(load_all_test_cffs(), number=1)
+    assert results["disagreements"] == 0
+
+
+def test_cff_schema_validator_does_not_treat_non_json_values_as_null():
+    cff: dict = load_cff("valid_cff_file")
+    cff["keywords"] = yaml.safe_load("[null, !!binary eA==, !!set {a}]")
+    errors = CffSchemaValidator().errors(cff)
+    assert not any("non-unique" in error for error in errors)
+    cff["type"] = yaml.safe_load("!!binary eA==")
+    assert "cff.type: b'x' is not one of ['dataset', 'software']" in (
+        CffSchemaValidator().errors(cff)
+    )
+
+
+def test_valid_cff_authors_without_names_are_skipped_or_use_alias():
+    cff: dict = load_cff("valid_cff_file")
+    cff["authors"] = [{}, {"alias": "x"}]
+    assert CffCoinSpan.is_valid_cff(cff) == (True, [])
+    cff_coin_span = CffCoinSpan.from_cff_dict(cff=cff)
+    assert [term for term in cff_coin_span.coin_span if term[0] == "rft.au"] == [
+        ("rft.au", "x")
+    ]
+
+
+def test_valid_cff_author_name_loaded_as_date():
+    cff: dict = load_cff("valid_cff_file")
+    cff["authors"] = yaml.safe_load("[{given-names: 2025-01-01, family-names: One}]")
+    assert CffCoinSpan.is_valid_cff(cff) == (True, [])
+    cff_coin_span = CffCoinSpan.from_cff_dict(cff=cff)
+    assert ("rft.au", "2025-01-01 One") in cff_coin_span.coin_span
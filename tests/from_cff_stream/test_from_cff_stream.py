@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from cff2coins import CffCoinSpan
+from tests.utils import run_from_cff_stream_test
+
+
+def test_from_cff_stream_for_multiple_cff_documents():
+    actual_json, expected_json = run_from_cff_stream_test("multiple_cff_documents")
+    assert actual_json == expected_json
+
+
+def test_from_cff_stream_stops_after_yaml_error():
+    cff_string = "title: missing-fields\n---\n[unclosed\n---\ntitle: never-read\n"
+    results = list(CffCoinSpan.from_cff_stream(cff_stream=cff_string))
+    assert len(results) == 2
+    assert isinstance(results[0].exception, ValueError)
+    assert results[1].cff_coin_span is None and results[1].exception is not None
+    assert [(result.source, result.index) for result in results] == [
+        (None, 0),
+        (None, 1),
+    ]
+
+
+def test_from_cff_stream_continues_after_invalid_date():
+    valid_cff_string = Path(
+        "tests", "from_cff_file", "cff_file_without_references", "input.cff"
+    ).read_text(encoding="UTF-8")
+    cff_string = "\n---\n".join(
+        [valid_cff_string, "date-released: 2025-02-30", valid_cff_string]
+    )
+    results = list(CffCoinSpan.from_cff_stream(cff_stream=cff_string))
+    assert [result.index for result in results] == [0, 1, 2]
+    assert results[0].exception is None
+    assert results[1].cff_coin_span is None
+    assert isinstance(results[1].exception, ValueError)
+    assert results[2].exception is None
+
+
+def test_from_cff_stream_skips_empty_trailing_document():
+    valid_cff_string = Path(
+        "tests", "from_cff_file", "cff_file_without_references", "input.cff"
+    ).read_text(encoding="UTF-8")
+    cff_string = f"---\n{valid_cff_string}\n---\n{valid_cff_string}\n---\n"
+    results = list(CffCoinSpan.from_cff_stream(cff_stream=cff_string))
+    assert [(result.index, result.exception) for result in results] == [
+        (0, None),
+        (1, None),
+    ]
@@ -0,0 +1,101 @@
+from pathlib import Path
+import json
+import tarfile
+import tempfile
+
+from cff2coins import CffCoinSpan
+from cff2coins.models.cff_coin_span_json_encoder import CffCoinSpanJsonEncoder
+from tests.utils import cff_coin_span_results_to_json
+
+
+def test_from_cff_tar_for_cff_files():
+    test_names = [
+        "cff_file_with_references",
+        "empty_cff_file",
+        "cff_file_without_references",
+    ]
+    input_cff_file_paths: list[Path] = [
+        Path("tests", "from_cff_file", test_name, "input.cff")
+        for test_name in test_names
+    ]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tar_file_path = Path(temp_dir, "cff_files.tar.gz")
+        with tarfile.open(tar_file_path, mode="w:gz") as tar:
+            for test_name, input_cff_file_path in zip(test_names, input_cff_file_paths):
+                tar.add(input_cff_file_path, arcname=f"{test_name}/CITATION.cff")
+            tar.add(Path("README.md"), arcname="README.md")
+
+        actual_json = cff_coin_span_results_to_json(
+            CffCoinSpan.from_cff_tar(tar_file_path=tar_file_path)
+        )
+
+    expected_results = []
+    for input_cff_file_path in input_cff_file_paths:
+        try:
+            expected_results.append(
+                CffCoinSpan.from_cff_file(cff_file_path=input_cff_file_path)
+            )
+        except ValueError as e:
+            expected_results.append({"exception": str(e)})
+    expected_json = json.dumps(
+        expected_results, cls=CffCoinSpanJsonEncoder, ensure_ascii=False
+    )
+    assert actual_json == expected_json
+
+
+def test_from_cff_tar_results_have_source_and_index():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        tar_file_path = Path(temp_dir, "cff_files.tar")
+        with tarfile.open(tar_file_path, mode="w") as tar:
+            tar.add(Path("README.md"), arcname="README.md")
+            tar.add(
+                Path("tests", "from_cff_file", "empty_cff_file", "input.cff"),
+                arcname="empty/CITATION.cff",
+            )
+            tar.add(
+                Path("tests", "from_cff_stream", "multiple_cff_documents", "input.cff"),
+                arcname="multiple/CITATION.cff",
+            )
+
+        results = list(CffCoinSpan.from_cff_tar(tar_file_path=tar_file_path))
+
+    assert [(result.source, result.index) for result in results] == [
+        ("empty/CITATION.cff", 0),
+        ("multiple/CITATION.cff", 0),
+        ("multiple/CITATION.cff", 1),
+        ("multiple/CITATION.cff", 2),
+    ]
+    assert [result.exception is None for result in results] == [
+        False,
+        True,
+        False,
+        True,
+    ]
+
+
+def test_from_cff_tar_continues_after_member_with_invalid_date():
+    input_cff_file_path = Path(
+        "tests", "from_cff_file", "cff_file_without_references", "input.cff"
+    )
+    with tempfile.TemporaryDirectory() as temp_dir:
+        invalid_cff_file_path = Path(temp_dir, "invalid.cff")
+        invalid_cff_file_path.write_text(
+            "cff-version: 1.2.0\ndate-released: 2025-02-30\n", encoding="UTF-8"
+        )
+        tar_file_path = Path(temp_dir, "cff_files.tar")
+        with tarfile.open(tar_file_path, mode="w") as tar:
+            tar.add(input_cff_file_path, arcname="first/CITATION.cff")
+            tar.add(invalid_cff_file_path, arcname="invalid/CITATION.cff")
+            tar.add(input_cff_file_path, arcname="last/CITATION.cff")
+
+        results = list(CffCoinSpan.from_cff_tar(tar_file_path=tar_file_path))
+
+    assert [(result.source, result.index) for result in results] == [
+        ("first/CITATION.cff", 0),
+        ("invalid/CITATION.cff", 0),
+        ("last/CITATION.cff", 0),
+    ]
+    assert results[0].exception is None
+    assert isinstance(results[1].exception, ValueError)
+    assert results[2].exception is None
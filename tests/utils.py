@@ -119,3 +119,34 @@ def run_to_html_string_test(test_name: str) -> tuple[str, str]:
         test_group=test_group, test_name=test_name, file_name="expected.html"
     )
     return actual_html, expected_html
+
+
+def cff_coin_span_results_to_json(results) -> str:
+    # an exception is written as {"exception": "<message>"}
+    return json.dumps(
+        [
+            (
+                result.cff_coin_span
+                if result.exception is None
+                else {"exception": str(result.exception)}
+            )
+            for result in results
+        ],
+        cls=CffCoinSpanJsonEncoder,
+        ensure_ascii=False,
+    )
+
+
+def run_from_cff_stream_test(test_name: str) -> tuple[str, str]:
+    test_group: str = "from_cff_stream"
+    input_cff_file_path: Path = Path("tests", test_group, test_name, "input.cff")
+
+    with open(input_cff_file_path, "r", encoding="UTF-8") as cff_stream:
+        actual_json = cff_coin_span_results_to_json(
+            CffCoinSpan.from_cff_stream(cff_stream=cff_stream)
+        )
+
+    expected_json: str = load_json_string(
+        test_group=test_group, test_name=test_name, file_name="expected.json"
+    )
+    return actual_json, expected_json